@@ -1,7 +1,9 @@
-import sqlite3
-import subprocess
+import collections
+import ntpath
+import operator
+import os
+import re
 import sys
-import webbrowser
 from pathlib import Path
 
 from flowlauncher import FlowLauncher
@@ -13,97 +15,142 @@ sys.path = [str(plugindir / p) for p in paths] + sys.path
 
 ZED_DB_PATH = Path.home() / "AppData/Local/Zed/db/0-stable/db.sqlite"
 
+_SLASHES = re.compile(r"/{2,}")
+
+# One deduplicated workspace row, as returned by _load_workspaces()
+Workspace = collections.namedtuple(
+    "Workspace", ("id", "path", "normalized", "name", "name_lower", "is_wsl")
+)
+
 
 def is_wsl_path(p: str) -> bool:
     """Detect whether a path belongs to WSL."""
     return p.startswith("/home/") or p.startswith("/mnt/")
 
 
+def basename(p: str) -> str:
+    """Return the last component of a Windows or POSIX path, or the path itself."""
+    # Like WindowsPath.name, ignore a drive or UNC share so roots have no name
+    s = ntpath.splitdrive(p)[1].rstrip("\\/")
+    return s[max(s.rfind("/"), s.rfind("\\")) + 1 :] or p
+
+
+def _sql_lower(value):
+    """Lowercase text with Python's full Unicode rules for use inside SQLite."""
+    return value.lower() if isinstance(value, str) else None
+
+
 def normalize(p: str) -> str:
     if not isinstance(p, str):
         return ""
-    s = p.replace("\\", "/")
-
-    while "//" in s:
-        s = s.replace("//", "/")
+    s = _SLASHES.sub("/", p.replace("\\", "/"))
 
-    if len(s) > 1 and s.endswith("/"):
-        s = s.rstrip("/")
+    if len(s) > 1 and s[-1] == "/":
+        s = s[:-1]
     return s.lower()
 
 
 class ZedWorkspaceSearch(FlowLauncher):
-    def _load_workspaces(self):
-        if not ZED_DB_PATH.exists():
-            return []
+    def _connect(self):
+        """Open the Zed database read-only."""
+        import sqlite3
+
+        con = sqlite3.connect(f"{ZED_DB_PATH.as_uri()}?mode=ro", uri=True, timeout=5.0)
+        # Unicode-aware lowercasing for queries LIKE cannot fold
+        con.create_function("py_lower", 1, _sql_lower, deterministic=True)
+        # Serve pages straight from the OS page cache and never write
+        con.executescript(
+            "PRAGMA mmap_size=67108864;"
+            "PRAGMA query_only=1;"
+            "PRAGMA temp_store=MEMORY;"
+        )
+        return con
+
+    def _load_workspaces(self, q=""):
+        import sqlite3
+
+        # A read-only open fails on a missing file, so no separate stat is needed
+        try:
+            con = self._connect()
+        except sqlite3.OperationalError:
+            return None
 
         try:
-            con = sqlite3.connect(ZED_DB_PATH)
             cur = con.cursor()
 
-            cur.execute("SELECT workspace_id, paths FROM workspaces")
+            if not q:
+                cur.execute("SELECT workspace_id, paths FROM workspaces")
+            elif q.isascii():
+                # Let SQLite's LIKE do the scan; it ignores case for ASCII letters
+                pattern = (
+                    q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                cur.execute(
+                    "SELECT workspace_id, paths FROM workspaces "
+                    "WHERE paths LIKE ? ESCAPE '\\'",
+                    (f"%{pattern}%",),
+                )
+            else:
+                # LIKE cannot fold non-ASCII letters, so lowercase each row in Python
+                cur.execute(
+                    "SELECT workspace_id, paths FROM workspaces "
+                    "WHERE instr(py_lower(paths), ?) > 0",
+                    (q,),
+                )
             rows = cur.fetchall()
-            con.close()
 
             by_normalized = {}
 
-            by_workspace_id = {}
+            # Bind hot helpers locally so the loop avoids global lookups
+            _normalize = normalize
+            _is_wsl = is_wsl_path
+            _basename = basename
 
             for wid, path in rows:
                 if not path or not isinstance(path, str):
                     continue
 
-                norm = normalize(path)
-
-                # If we've already seen this normalized path, prefer the earliest record
-                if norm not in by_normalized:
-                    by_normalized[norm] = {
-                        "id": wid,
-                        "path": path,
-                        "normalized": norm,
-                        "is_wsl": is_wsl_path(path),
-                    }
-                else:
-                    existing = by_normalized[norm]["path"]
-                    if len(path) < len(existing):
-                        by_normalized[norm] = {
-                            "id": wid,
-                            "path": path,
-                            "normalized": norm,
-                            "is_wsl": is_wsl_path(path),
-                        }
-
-                # track shortest path per workspace_id as fallback
-                if wid not in by_workspace_id or len(path) < len(
-                    by_workspace_id[wid]["path"]
-                ):
-                    by_workspace_id[wid] = {
-                        "id": wid,
-                        "path": path,
-                        "normalized": norm,
-                        "is_wsl": is_wsl_path(path),
-                    }
-
-            # Prefer the normalized-set
-            results = (
-                list(by_normalized.values())
-                if by_normalized
-                else list(by_workspace_id.values())
-            )
+                norm = _normalize(path)
+
+                # If we've already seen this normalized path, keep the shortest record
+                entry = by_normalized.get(norm)
+                if entry is None or len(path) < len(entry.path):
+                    name = _basename(path)
+                    by_normalized[norm] = Workspace(
+                        wid, path, norm, name, name.lower(), _is_wsl(path)
+                    )
+
+            results = list(by_normalized.values())
+
+            # Nothing matched a filter; only report "no workspaces" if none are stored
+            if not results and (
+                not q
+                or cur.execute(
+                    "SELECT 1 FROM workspaces "
+                    "WHERE typeof(paths) = 'text' AND paths != '' LIMIT 1"
+                ).fetchone()
+                is None
+            ):
+                return None
 
             # Sort results
-            results.sort(key=lambda r: Path(r["path"]).name.lower())
+            results.sort(key=operator.attrgetter("name_lower"))
 
             return results
 
         except Exception as e:
-            return [{"id": -1, "path": f"<Error reading DB: {e}>", "is_wsl": False}]
+            error = f"<Error reading DB: {e}>"
+            return [Workspace(-1, error, "", error, "", False)]
+
+        finally:
+            con.close()
 
     def query(self, query):
         q = query.lower().strip()
-        workspaces = self._load_workspaces()
+        workspaces = self._load_workspaces(q)
 
-        if not workspaces:
+        # An empty list just means nothing matched the query
+        if workspaces is None:
             return [
                 {
                     "Title": "No Zed workspaces found",
@@ -112,48 +159,25 @@ class ZedWorkspaceSearch(FlowLauncher):
                 }
             ]
 
-        filtered = (
-            [w for w in workspaces if q in w["path"].lower()] if q else workspaces
-        )
-
-        results = []
-        for w in filtered:
-            # Use the path's last part for name
-            try:
-                name = Path(w["path"]).name or w["path"]
-            except Exception:
-                name = w["path"]
-
-            # Label WSL workspaces clearly
-            if w["is_wsl"]:
-                title = f"{name}  (WSL)"
-            else:
-                title = name
-
-            results.append(
-                {
-                    "Title": title,
-                    "SubTitle": w["path"],
-                    "IcoPath": "assets/zed.png",
-                    "JsonRPCAction": {
-                        "method": "open_workspace",
-                        "parameters": [w["path"]],
-                    },
-                    "ContextData": [w["path"]],
-                }
-            )
-
-        unique = []
-        seen = set()
-        for r in results:
-            key = (r["Title"].strip().lower(), r["SubTitle"].strip().lower())
-            if key not in seen:
-                seen.add(key)
-                unique.append(r)
-
-        return unique
+        # Label WSL workspaces clearly
+        return [
+            {
+                "Title": f"{w.name}  (WSL)" if w.is_wsl else w.name,
+                "SubTitle": w.path,
+                "IcoPath": "assets/zed.png",
+                "JsonRPCAction": {
+                    "method": "open_workspace",
+                    "parameters": [w.path],
+                },
+                "ContextData": [w.path],
+            }
+            for w in workspaces
+        ]
 
     def open_workspace(self, path):
+        import subprocess
+        import webbrowser
+
         if is_wsl_path(path):
             # Open inside WSL
             subprocess.Popen(
@@ -164,10 +188,9 @@ class ZedWorkspaceSearch(FlowLauncher):
             return
 
         # Normal Windows path
-        p = Path(path)
-        if p.exists():
+        if os.path.exists(path):
             subprocess.Popen(
-                ["zed", str(p)], shell=False, creationflags=subprocess.CREATE_NO_WINDOW
+                ["zed", path], shell=False, creationflags=subprocess.CREATE_NO_WINDOW
             )
         else:
             webbrowser.open("file:///")
@@ -192,6 +215,8 @@ class ZedWorkspaceSearch(FlowLauncher):
 
     def open_in_zed(self, path):
         """Open workspace using the appropriate environment."""
+        import subprocess
+
         if is_wsl_path(path):
             subprocess.Popen(
                 ["wsl", "zed", path],